@@ -1,7 +1,8 @@
+import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 from app.database import Base
@@ -60,26 +61,40 @@ def run_migrations_offline() -> None:
                 context.run_migrations()
 
 
-def run_migrations_online() -> None:
-        """Run migrations in 'online' mode.
+def do_run_migrations(connection) -> None:
+        context.configure(
+                connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+                context.run_migrations()
+
 
-        In this scenario we need to create an Engine
-        and associate a connection with the context.
+async def run_async_migrations() -> None:
+        """In this scenario we need to create an async Engine
+        and run the migrations on a sync facade of its connection.
 
         """
-        connectable = engine_from_config(
+        connectable = async_engine_from_config(
                 config.get_section(config.config_ini_section, {}),
                 prefix="sqlalchemy.",
                 poolclass=pool.NullPool,
         )
 
-        with connectable.connect() as connection:
-                context.configure(
-                        connection=connection, target_metadata=target_metadata
-                )
+        async with connectable.connect() as connection:
+                await connection.run_sync(do_run_migrations)
 
-                with context.begin_transaction():
-                        context.run_migrations()
+        await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+        """Run migrations in 'online' mode.
+
+        The application database URL uses an async driver, so the
+        migrations are driven through an asyncio event loop.
+
+        """
+        asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
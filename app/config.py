@@ -3,6 +3,14 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DEBUG: bool = False
+    ENVIRONMENT: str = "development"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000
+    RESPONSE_CACHE_TTL: int = 30
+    RESPONSE_CACHE_MAXSIZE: int = 1024
 
     class Config:
         env_file = ".env"
@@ -1,31 +1,28 @@
-from sqlalchemy import create_engine, pool
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
-Base = declarative_base()
-SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
-
 
-class DBSession:
-    def __init__(self):
-        engine = create_engine(
-            SQLALCHEMY_DATABASE_URL,
-            poolclass=pool.QueuePool,
-            pool_size=10000,
-            max_overflow=8000,
-        )
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        self.db = SessionLocal()
+class Base(DeclarativeBase):
+    pass
 
-    def __enter__(self):
-        return self.db
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.db.close()
 
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-def get_db():
-    with DBSession() as db:
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=settings.DB_INSERTMANYVALUES_PAGE_SIZE,
+)
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
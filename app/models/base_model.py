@@ -1,36 +1,165 @@
+import datetime
+import os
+import time
 import uuid
+from typing import List, Union
 from app.database import Base
-from sqlalchemy.orm import Session
-from sqlalchemy import Column, DateTime, func, String
-from app.utils.constants import PAGE_SIZE
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Column,
+    DateTime,
+    delete,
+    func,
+    inspect,
+    insert,
+    select,
+    tuple_,
+    update,
+    Uuid,
+)
+from sqlalchemy.orm import load_only, raiseload
+from app.schemas.base_schemas import NotFoundErrorResponse
+from app.utils.constants import PAGE_SIZE, STREAM_CHUNK_SIZE
+from app.utils.helper_functions import decode_cursor, encode_cursor
 
 
 def generate_uuid():
-    return str(uuid.uuid4())
+    # UUIDv7 (RFC 9562): a 48-bit millisecond timestamp followed by random
+    # bits, so new keys land at the right edge of the primary key index.
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= (rand >> 68) << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
 
 
 class BaseModel(Base):
     __abstract__ = True
+    # Columns that list queries may be sorted and searched by. Subclasses
+    # extend these with their own column names.
+    __sortable__ = ("created_at", "updated_at")
+    __searchable__ = ()
 
     id = Column(
-        String(36),
+        Uuid(as_uuid=True),
         primary_key=True,
         default=generate_uuid,
         unique=True,
         nullable=False,
     )
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
+    def __init_subclass__(cls, **kwargs):
+        # Base maps the class here, so its table exists once this returns.
+        super().__init_subclass__(**kwargs)
+        if "__table__" not in cls.__dict__:
+            return
+        cls._column_names = tuple(column.name for column in cls.__table__.columns)
+        cls._sort_columns = {
+            name: cls.__table__.c[name] for name in cls.__sortable__
+        }
+        cls._search_columns = {
+            name: cls.__table__.c[name] for name in cls.__searchable__
         }
 
     @classmethod
-    def get_all(
+    def _sort_column(cls, sort_by: str):
+        try:
+            return cls._sort_columns[sort_by]
+        except KeyError:
+            raise ValueError(f"Cannot sort by {sort_by!r}")
+
+    @classmethod
+    def _search_column(cls, search_field: str):
+        try:
+            return cls._search_columns[search_field]
+        except KeyError:
+            raise ValueError(f"Cannot search by {search_field!r}")
+
+    @staticmethod
+    def _coerce_id(instance_id):
+        if isinstance(instance_id, uuid.UUID):
+            return instance_id
+        return uuid.UUID(instance_id)
+
+    @staticmethod
+    def _coerce_datetime(value):
+        # asyncpg binds a str as VARCHAR, which PostgreSQL will not compare
+        # with a timestamptz column.
+        if isinstance(value, datetime.datetime):
+            return value
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date: {value!r}")
+
+    def to_dict(self, fields: list = None, include_relationships: bool = False):
+        record = {name: getattr(self, name) for name in fields or self._column_names}
+        if include_relationships:
+            # Only relationships that were eager loaded; touching the others
+            # would emit a query per instance.
+            state = inspect(self)
+            for name in state.mapper.relationships.keys():
+                if name in state.unloaded:
+                    continue
+                related = getattr(self, name)
+                if related is None:
+                    record[name] = None
+                elif isinstance(related, BaseModel):
+                    record[name] = related.to_dict()
+                else:
+                    record[name] = [item.to_dict() for item in related]
+        return record
+
+    @classmethod
+    def _select_columns(cls, fields: list = None, *required: str):
+        if not fields:
+            return list(cls.__table__.columns)
+        unknown = set(fields).difference(cls.__table__.columns.keys())
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        # dict.fromkeys keeps a stable column order for the statement cache
+        names = dict.fromkeys([*fields, *required])
+        return [cls.__table__.c[name] for name in names]
+
+    @classmethod
+    def _filter_predicates(
         cls,
-        db: Session,
+        min_date: str = None,
+        max_date: str = None,
+        min_value: int = None,
+        max_value: int = None,
+        search_field: str = None,
+        search: str = None,
+    ):
+        predicates = []
+        if min_date is not None:
+            predicates.append(cls.created_at >= cls._coerce_datetime(min_date))
+        if max_date is not None:
+            predicates.append(cls.created_at <= cls._coerce_datetime(max_date))
+        if min_value is not None:
+            predicates.append(cls.value >= min_value)
+        if max_value is not None:
+            predicates.append(cls.value <= max_value)
+        if search_field and search:
+            predicates.append(cls._search_column(search_field).ilike(f"%{search}%"))
+        return predicates
+
+    @classmethod
+    def _build_filtered_query(
+        cls,
+        query,
         sort_by: str = "created_at",
         order: str = "asc",
         min_date: str = None,
@@ -40,31 +169,61 @@ class BaseModel(Base):
         search_field: str = None,
         search: str = None,
     ):
-        query = db.query(cls)
-        if min_date:
-            query = query.filter(cls.created_at >= min_date)
-        if max_date:
-            query = query.filter(cls.created_at <= max_date)
-        if min_value:
-            query = query.filter(cls.value >= min_value)
-        if max_value:
-            query = query.filter(cls.value <= max_value)
-        if search_field and search:
-            query = query.filter(getattr(cls, search_field).ilike(f"%{search}%"))
+        query = query.where(
+            *cls._filter_predicates(
+                min_date, max_date, min_value, max_value, search_field, search
+            )
+        )
+        # id breaks ties so that keyset pagination sees a total order
+        sort_column = cls._sort_column(sort_by)
         if order == "desc":
-            query = query.order_by(getattr(cls, sort_by).desc())
-        else:
-            query = query.order_by(getattr(cls, sort_by).asc())
+            return query.order_by(sort_column.desc(), cls.id.desc())
+        return query.order_by(sort_column.asc(), cls.id.asc())
 
-        instances = query.all()
-        return [instance.to_dict() for instance in instances]
+    @classmethod
+    def _keyset_predicate(cls, sort_by: str, order: str, cursor: str):
+        last_sort_value, last_id = decode_cursor(cursor)
+        sort_column = cls._sort_column(sort_by)
+        python_type = sort_column.type.python_type
+        if isinstance(last_sort_value, str) and python_type is not str:
+            if python_type is datetime.datetime:
+                last_sort_value = datetime.datetime.fromisoformat(last_sort_value)
+            else:
+                last_sort_value = python_type(last_sort_value)
+        if not isinstance(last_sort_value, python_type):
+            raise ValueError("Invalid pagination cursor")
+
+        last_id = cls._coerce_id(last_id)
+
+        key = tuple_(sort_column, cls.id)
+        if order == "desc":
+            return key < tuple_(last_sort_value, last_id)
+        return key > tuple_(last_sort_value, last_id)
 
     @classmethod
-    def get_paginated(
+    async def _count(
         cls,
-        db: Session,
-        page: int = 1,
-        limit: int = PAGE_SIZE,
+        db: AsyncSession,
+        min_date: str = None,
+        max_date: str = None,
+        min_value: int = None,
+        max_value: int = None,
+        search_field: str = None,
+        search: str = None,
+    ):
+        # A plain count(*) over the same predicates, not wrapped around the
+        # list query as a subquery, so the planner can count from an index.
+        predicates = cls._filter_predicates(
+            min_date, max_date, min_value, max_value, search_field, search
+        )
+        return await db.scalar(
+            select(func.count()).select_from(cls).where(*predicates)
+        )
+
+    @classmethod
+    async def get_all(
+        cls,
+        db: AsyncSession,
         sort_by: str = "created_at",
         order: str = "asc",
         min_date: str = None,
@@ -73,30 +232,108 @@ class BaseModel(Base):
         max_value: int = None,
         search_field: str = None,
         search: str = None,
+        fields: list = None,
+        options: list = None,
+        limit: int = None,
+        offset: int = 0,
     ):
-        query = db.query(cls)
-        if min_date:
-            query = query.filter(cls.created_at >= min_date)
-        if max_date:
-            query = query.filter(cls.created_at <= max_date)
-        if min_value:
-            query = query.filter(cls.value >= min_value)
-        if max_value:
-            query = query.filter(cls.value <= max_value)
-        if search_field and search:
-            query = query.filter(getattr(cls, search_field).ilike(f"%{search}%"))
-        if order == "desc":
-            query = query.order_by(getattr(cls, sort_by).desc())
-        else:
-            query = query.order_by(getattr(cls, sort_by).asc())
+        if options:
+            return await cls._get_all_with_relationships(
+                db,
+                options,
+                sort_by,
+                order,
+                min_date,
+                max_date,
+                min_value,
+                max_value,
+                search_field,
+                search,
+                fields,
+                limit,
+                offset,
+            )
+
+        # List queries select table columns and read plain mappings instead of
+        # materializing ORM instances only to convert them back to dicts.
+        query = cls._build_filtered_query(
+            select(*cls._select_columns(fields)),
+            sort_by,
+            order,
+            min_date,
+            max_date,
+            min_value,
+            max_value,
+            search_field,
+            search,
+        ).limit(limit).offset(offset)
 
-        instances = db.query(cls).limit(limit).offset((page - 1) * limit).all()
-        return [instance.to_dict() for instance in instances]
+        # Rows are read from a server-side cursor in bounded chunks, so the
+        # driver never buffers an unpaginated table in one piece.
+        result = await db.stream(
+            query.execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        records = []
+        async for partition in result.mappings().partitions():
+            records.extend(dict(row) for row in partition)
+        return records
 
     @classmethod
-    def get_pagination_metadata(
+    async def _get_all_with_relationships(
+        cls,
+        db: AsyncSession,
+        options: list,
+        sort_by: str = "created_at",
+        order: str = "asc",
+        min_date: str = None,
+        max_date: str = None,
+        min_value: int = None,
+        max_value: int = None,
+        search_field: str = None,
+        search: str = None,
+        fields: list = None,
+        limit: int = None,
+        offset: int = 0,
+    ):
+        # Related rows need ORM instances. raiseload("*") turns any
+        # relationship not named in options into an error instead of a
+        # silent lazy load per row during serialization.
+        query = select(cls).options(raiseload("*"), *options)
+        if fields:
+            columns = cls._select_columns(fields, "id")
+            query = query.options(
+                load_only(*(getattr(cls, column.key) for column in columns))
+            )
+        query = cls._build_filtered_query(
+            query,
+            sort_by,
+            order,
+            min_date,
+            max_date,
+            min_value,
+            max_value,
+            search_field,
+            search,
+        ).limit(limit).offset(offset)
+
+        # Streamed in chunks like the column path. selectinload runs one
+        # IN (...) query per chunk and relationship, so memory stays bounded
+        # however many parents match.
+        result = await db.stream_scalars(
+            query.execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        records = []
+        async for partition in result.partitions():
+            records.extend(
+                instance.to_dict(fields, include_relationships=True)
+                for instance in partition
+            )
+        return records
+
+    @classmethod
+    async def get_paginated(
         cls,
-        db: Session,
+        db: AsyncSession,
         page: int = 1,
         limit: int = PAGE_SIZE,
         sort_by: str = "created_at",
@@ -107,63 +344,229 @@ class BaseModel(Base):
         max_value: int = None,
         search_field: str = None,
         search: str = None,
+        cursor: str = None,
+        fields: list = None,
+        include_total: bool = True,
     ):
-        query = db.query(cls)
-        if min_date:
-            query = query.filter(cls.created_at >= min_date)
-        if max_date:
-            query = query.filter(cls.created_at <= max_date)
-        if min_value:
-            query = query.filter(cls.value >= min_value)
-        if max_value:
-            query = query.filter(cls.value <= max_value)
-        if search_field and search:
-            query = query.filter(getattr(cls, search_field).ilike(f"%{search}%"))
-        if order == "desc":
-            query = query.order_by(getattr(cls, sort_by).desc())
+        """Return one page of records together with its pagination metadata.
+
+        Without a cursor the page is located by OFFSET and the total count is
+        computed by a ``count(*) OVER ()`` window in the same statement. With
+        a cursor (the ``next_cursor`` of the previous page) the page is
+        located by seeking past the last ``(sort_by, id)`` key instead, which
+        costs the same regardless of how deep the page is. The total then
+        needs a separate ``count(*)`` over every matching row; pass
+        ``include_total=False`` to skip it and leave the total as None.
+        """
+        keyset = cursor is not None
+        # the sort key is always selected to build next_cursor
+        columns = cls._select_columns(fields, cls._sort_column(sort_by).key, "id")
+        if not keyset:
+            columns.append(func.count().over().label("_total"))
+        query = cls._build_filtered_query(
+            select(*columns),
+            sort_by,
+            order,
+            min_date,
+            max_date,
+            min_value,
+            max_value,
+            search_field,
+            search,
+        )
+        if keyset:
+            query = query.where(cls._keyset_predicate(sort_by, order, cursor))
         else:
-            query = query.order_by(getattr(cls, sort_by).asc())
+            query = query.offset((page - 1) * limit)
 
-        total_count = query.count()
-        total_pages = (total_count + limit - 1) // limit
+        # One extra row tells whether there is a next page.
+        result = await db.execute(query.limit(limit + 1))
+        rows = result.mappings().all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        if rows and not keyset:
+            total_count = rows[0]["_total"]
+        elif keyset and not include_total:
+            total_count = None
+        elif keyset or page > 1:
+            # The window count is unavailable past the end of the results and
+            # would only cover the rows after the cursor in keyset mode.
+            total_count = await cls._count(
+                db, min_date, max_date, min_value, max_value, search_field, search
+            )
+        else:
+            total_count = 0
+
+        next_cursor = None
+        if has_next:
+            next_cursor = encode_cursor(rows[-1][sort_by], rows[-1]["id"])
+
+        names = fields or cls._column_names
+        records = [{name: row[name] for name in names} for row in rows]
+        return records, cls.get_pagination_metadata(
+            total_count, page, limit, next_cursor
+        )
+
+    @classmethod
+    def get_pagination_metadata(
+        cls,
+        total_count: int,
+        page: int = 1,
+        limit: int = PAGE_SIZE,
+        next_cursor: str = None,
+    ):
+        total_pages = None
+        if total_count is not None:
+            total_pages = (total_count + limit - 1) // limit
         return dict(
             total_count=total_count,
             total_pages=total_pages,
             current_page=page,
             page_size=limit,
+            next_cursor=next_cursor,
         )
 
     @classmethod
-    def get_by_id(cls, instance_id: str, db: Session):
-        instance = db.query(cls).filter(cls.id == instance_id).first()
-        return instance.to_dict() if instance else None
+    async def get_version(cls, db: AsyncSession, instance_id: Union[uuid.UUID, str]):
+        # A record's updated_at moves on every update, which makes it a cheap
+        # HTTP validator for that one row. Lists have no such marker (updated_at
+        # is the transaction start time, and deletes leave no trace), so list
+        # responses are validated by a hash of their body instead.
+        return await db.scalar(
+            select(cls.updated_at).where(cls.id == cls._coerce_id(instance_id))
+        )
 
     @classmethod
-    def create(cls, db: Session, **kwargs):
-        instance = cls(**kwargs)
-        db.add(instance)
-        db.commit()
-        db.refresh(instance)
-        return instance.to_dict()
+    async def get_by_id(
+        cls, instance_id: Union[uuid.UUID, str], db: AsyncSession, cache: dict = None
+    ):
+        instance_id = cls._coerce_id(instance_id)
+        key = (cls, instance_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        result = await db.execute(select(cls).where(cls.id == instance_id))
+        instance = result.scalars().first()
+        record = instance.to_dict() if instance else None
+        if cache is not None:
+            cache[key] = record
+        return record
 
     @classmethod
-    def update(cls, instance_id: str, db: Session, **kwargs):
-        instance = db.query(cls).filter(cls.id == instance_id).first()
-        if instance:
-            for key, value in kwargs.items():
-                setattr(instance, key, value)
-            db.commit()
-            db.refresh(instance)
-            return instance.to_dict()
-        else:
-            return None
+    async def get_by_ids(
+        cls, db: AsyncSession, ids: List[Union[uuid.UUID, str]], cache: dict = None
+    ):
+        ids = dict.fromkeys(cls._coerce_id(instance_id) for instance_id in ids)
+        records = {}
+        missing = []
+        for instance_id in ids:
+            key = (cls, instance_id)
+            if cache is None or key not in cache:
+                missing.append(instance_id)
+            elif cache[key] is not None:
+                # a cached None is a known miss and is not queried again
+                records[instance_id] = cache[key]
+        if not missing:
+            return records
+
+        # One SELECT ... WHERE id IN (...) for every id not already cached,
+        # instead of a request and a query per id.
+        result = await db.execute(
+            select(*cls.__table__.columns).where(cls.id.in_(missing))
+        )
+        for row in result.mappings():
+            records[row["id"]] = dict(row)
+        if cache is not None:
+            for instance_id in missing:
+                cache[(cls, instance_id)] = records.get(instance_id)
+        return records
 
     @classmethod
-    def delete(cls, instance_id: str, db: Session):
-        instance = db.query(cls).filter(cls.id == instance_id).first()
-        if instance:
-            db.delete(instance)
-            db.commit()
-            return True
-        else:
-            return False
+    async def create(cls, db: AsyncSession, **kwargs):
+        # RETURNING hands back the server generated timestamps in the same
+        # round trip instead of a refresh SELECT after the commit.
+        result = await db.execute(
+            insert(cls).values(**kwargs).returning(*cls.__table__.columns)
+        )
+        row = result.mappings().one()
+        await db.commit()
+        return dict(row)
+
+    @classmethod
+    async def bulk_create(cls, db: AsyncSession, items: List[dict]):
+        if not items:
+            return []
+        # An executemany INSERT ... RETURNING is batched by SQLAlchemy into
+        # multi-row statements, so the whole list costs one commit.
+        result = await db.execute(
+            insert(cls).returning(*cls.__table__.columns), items
+        )
+        rows = result.mappings().all()
+        await db.commit()
+        return [dict(row) for row in rows]
+
+    @classmethod
+    async def bulk_update(cls, db: AsyncSession, items: List[dict]):
+        if not items:
+            return []
+        items = [{**item, "id": cls._coerce_id(item["id"])} for item in items]
+        ids = list(dict.fromkeys(item["id"] for item in items))
+        # Drivers such as asyncpg report no per-row rowcount for executemany,
+        # so unmatched ids are found up front. FOR UPDATE keeps the matched
+        # rows from being deleted before the UPDATE below runs.
+        result = await db.execute(
+            select(cls.id).where(cls.id.in_(ids)).with_for_update()
+        )
+        missing = set(ids).difference(result.scalars())
+        if missing:
+            await db.rollback()
+            raise NotFoundErrorResponse(
+                f"No {cls.__name__} Found With Ids: "
+                + ", ".join(sorted(str(instance_id) for instance_id in missing))
+            )
+
+        # ORM bulk UPDATE by primary key: one executemany statement for the
+        # whole list, matched on the "id" key of every item.
+        await db.execute(update(cls), items)
+        await db.commit()
+        return ids
+
+    @classmethod
+    async def update(
+        cls,
+        instance_id: Union[uuid.UUID, str],
+        db: AsyncSession,
+        cache: dict = None,
+        **kwargs,
+    ):
+        instance_id = cls._coerce_id(instance_id)
+        result = await db.execute(
+            update(cls)
+            .where(cls.id == instance_id)
+            .values(**kwargs)
+            .returning(*cls.__table__.columns)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.mappings().one_or_none()
+        await db.commit()
+        record = dict(row) if row else None
+        if cache is not None:
+            cache[(cls, instance_id)] = record
+        return record
+
+    @classmethod
+    async def delete(
+        cls, instance_id: Union[uuid.UUID, str], db: AsyncSession, cache: dict = None
+    ):
+        instance_id = cls._coerce_id(instance_id)
+        result = await db.execute(
+            delete(cls)
+            .where(cls.id == instance_id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.rowcount > 0
+        await db.commit()
+        if cache is not None:
+            cache.pop((cls, instance_id), None)
+        return deleted
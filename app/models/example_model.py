@@ -1,9 +1,27 @@
 from app.models.base_model import BaseModel
-from sqlalchemy import String, Column, Integer
+from sqlalchemy import String, Column, Index, Integer
 
 
 class ExampleModel(BaseModel):
     __tablename__ = "example"
+    __table_args__ = (
+        Index("ix_example_created_at_id", "created_at", "id"),
+        # Trigram indexes let ILIKE '%term%' searches avoid a sequential scan.
+        Index(
+            "ix_example_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_example_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
+    __sortable__ = ("created_at", "updated_at", "name", "value")
+    __searchable__ = ("name", "description")
     name = Column(String(255), nullable=False)
     value = Column(Integer, nullable=False)
     description = Column(String(255), nullable=False)
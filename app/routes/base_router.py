@@ -1,10 +1,22 @@
-from fastapi import APIRouter, Depends, status, Body, Query, HTTPException
-from sqlalchemy.orm import Session
+import datetime
+import hashlib
+import uuid
+from typing import List
+
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, status, Body, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import create_model
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.base_schemas import (APIBaseListResponse, APIBasePaginatedResponse,
     APIBaseResponse, ErrorResponse, NotFoundErrorResponse)
-from app.utils.helper_functions import handle_exceptions
-from app.utils.constants import PAGE_SIZE
+from app.utils.cache_utils import response_cache
+from app.utils.helper_functions import get_request_cache
+from app.utils.constants import (BULK_MAX_LENGTH, DATABASE_ERROR_DESCRIPTION,
+    GET_ALL_LIMIT, GET_ALL_MAX_LIMIT, GET_BY_IDS_MAX_LENGTH, PAGE_SIZE,
+    PAGE_SIZE_MAX, SERVER_ERROR_DESCRIPTION)
 
 
 class BaseRouter:
@@ -20,30 +32,81 @@ class BaseRouter:
         update_schema,
         read_permissions,
         write_permissions,
+        eager_load=None,
+        response_struct=None,
     ):
-        self.router = APIRouter()
+        if eager_load and response_struct is not None:
+            # msgspec.convert drops keys the struct does not declare, which
+            # would silently lose the eager loaded relationships.
+            raise ValueError("eager_load cannot be combined with response_struct")
+
+        self.router = APIRouter(default_response_class=ORJSONResponse)
         self.model = model
         self.get_response_schema = get_response_schema
         self.get_paginated_schema = get_paginated_schema
         self.get_all_schema = get_all_schema
         self.create_schema = create_schema
         self.update_schema = update_schema
+        self.bulk_update_schema = create_model(
+            f"{update_schema.__name__}WithId",
+            __base__=update_schema,
+            id=(uuid.UUID, ...),
+        )
         self.read_permissions = read_permissions
         self.write_permissions = write_permissions
+        # Loader options for the /all listing. Use selectinload(Model.items)
+        # for one-to-many and many-to-many relationships: it adds one
+        # WHERE id IN (...) query per relationship and works with the
+        # streamed, chunked read. Use joinedload(Model.owner) only for
+        # many-to-one. Joining collections multiplies the rows per parent,
+        # and joined collections cannot be streamed with yield_per.
+        self.eager_load = eager_load
+        # Optional msgspec.Struct for the records of GET responses. When set,
+        # GET records are converted into it and every response of this router
+        # is encoded by msgspec, so all endpoints format values the same way.
+        self.response_struct = response_struct
+        if response_struct is not None:
+            self._struct_list_type = List[response_struct]
+            self._encoder = msgspec.json.Encoder()
+
+        # Response messages only depend on the model, so they are formatted
+        # once here rather than on every request.
+        self._model_name = model.__name__
+        self._msg_none_found = f"No {self._model_name} records found"
+        self._msg_all_found = f"All {self._model_name} records"
+        self._msg_found = f"{self._model_name} Found"
+        self._msg_not_found_id = f"No {self._model_name} Found With Given Id"
+        self._msg_create_failed = f"Error Occurred While Creating {self._model_name}"
+        self._msg_created = f"{self._model_name} Created Successfully"
+        self._msg_updated = f"{self._model_name} Updated Successfully"
+        self._msg_deleted = f"{self._model_name} Deleted Successfully"
 
         self.base_response = {
             status.HTTP_404_NOT_FOUND: {
-                "description": f"No {self.model.__name__} found."
+                "description": f"No {self._model_name} found."
             },
             420: {
                 "model": ErrorResponse,
-                "description": f"A database error occurred while processing the request. This could be due to a connection issue, a query error, or a data integrity issue.",
+                "description": DATABASE_ERROR_DESCRIPTION,
             },
             status.HTTP_500_INTERNAL_SERVER_ERROR: {
                 "model": ErrorResponse,
-                "description": f"An unexpected error occurred while processing the request. This could be due to a server issue or an unexpected exception.",
+                "description": SERVER_ERROR_DESCRIPTION,
             },
         }
+        # The OpenAPI responses only depend on the model and schemas, so they
+        # are built once here instead of on every route registration.
+        self._responses = {
+            "get_all": self.get_all_responses(),
+            "get_paginated": self.get_paginated_records_responses(),
+            "get_one": self.get_record_responses(),
+            "get_by_ids": self.get_records_by_ids_responses(),
+            "create": self.create_responses(),
+            "bulk_create": self.bulk_create_responses(),
+            "update": self.update_responses(),
+            "bulk_update": self.bulk_update_responses(),
+            "delete": self.delete_responses(),
+        }
 
         self.include_endpoints()
 
@@ -53,7 +116,10 @@ class BaseRouter:
         self.generate_get_all_endpoint()
         self.generate_get_paginated_endpoint()
         self.generate_get_by_id_endpoint()
+        self.generate_get_by_ids_endpoint()
         self.generate_create_endpoint()
+        self.generate_bulk_create_endpoint()
+        self.generate_bulk_update_endpoint()
         self.generate_update_endpoint()
         self.generate_delete_endpoint()
 
@@ -63,15 +129,17 @@ class BaseRouter:
     # endpoints
 
     def generate_create_endpoint(self):
+        create_new_record = self.create_new_record
+        json_response = self.json_response
+
         @self.router.post(
             "/",
             status_code=status.HTTP_201_CREATED,
-            responses=self.create_responses(),
+            responses=self._responses["create"],
         )
-        @handle_exceptions
         async def create_record(
             request: self.create_schema = Body(...),
-            db: Session = Depends(get_db),
+            db: AsyncSession = Depends(get_db),
             permissions: dict = Depends(self.write_permissions),
         ):
             """
@@ -88,17 +156,57 @@ class BaseRouter:
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
             """
-            return self.create_new_record(request, db)
+            return json_response(
+                await create_new_record(request, db), status.HTTP_201_CREATED
+            )
+
+    def generate_bulk_create_endpoint(self):
+        bulk_create_records = self.bulk_create_records
+        json_response = self.json_response
+
+        @self.router.post(
+            "/bulk",
+            status_code=status.HTTP_201_CREATED,
+            responses=self._responses["bulk_create"],
+        )
+        async def create_records(
+            request: List[self.create_schema] = Body(..., max_length=BULK_MAX_LENGTH),
+            db: AsyncSession = Depends(get_db),
+            permissions: dict = Depends(self.write_permissions),
+        ):
+            """
+            Create several records at once.
+
+            This endpoint creates all records provided in the request with a single batched insert and one commit.
+
+            :param request: The request body containing the list of records to create, at most BULK_MAX_LENGTH of them.
+            :param db: Database session dependency.
+            :param permissions: Permission dependency.
+
+            :return: A success message upon successful creation of the records along with the records' details.
+
+            :raises HTTPException(420): If a database error occurs.
+            :raises HTTPException(500): If any other error occurred.
+            """
+            return json_response(
+                await bulk_create_records(request, db), status.HTTP_201_CREATED
+            )
 
     def generate_get_all_endpoint(self):
+        cached_response = self.cached_response
+        get_all_records = self.get_all_records
+
         @self.router.get(
             "/all",
             status_code=status.HTTP_200_OK,
-            responses=self.get_all_responses(),
+            responses=self._responses["get_all"],
         )
-        @handle_exceptions
-        async def get_records(
-            db: Session = Depends(get_db),
+        async def get_all(
+            request: Request,
+            limit: int = Query(GET_ALL_LIMIT, ge=1, le=GET_ALL_MAX_LIMIT),
+            offset: int = Query(0, ge=0),
+            fields: List[str] = Query(None),
+            db: AsyncSession = Depends(get_db),
             permissions: dict = Depends(self.read_permissions),
         ):
             """
@@ -106,6 +214,10 @@ class BaseRouter:
 
             This endpoint retrieves all records from the database and returns the record details.
 
+            :param request: The incoming request, used for response caching.
+            :param limit: The maximum number of records to return, at most GET_ALL_MAX_LIMIT.
+            :param offset: The number of records to skip before the first one returned.
+            :param fields: The columns to return for each record. All columns are returned if omitted.
             :param db: Database session dependency.
             :param permissions: Permission dependency.
 
@@ -115,27 +227,39 @@ class BaseRouter:
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
             """
-            return self.get_all_records(db)
+            return await cached_response(
+                request,
+                permissions,
+                lambda: get_all_records(
+                    db, fields=fields, limit=limit, offset=offset
+                ),
+            )
 
     def generate_get_paginated_endpoint(self):
+        cached_response = self.cached_response
+        get_paginated_records = self.get_paginated_records
+
         @self.router.get(
             "/paginated",
             status_code=status.HTTP_200_OK,
-            responses=self.get_paginated_records_responses(),
+            responses=self._responses["get_paginated"],
         )
-        @handle_exceptions
-        async def get_records(
-            page: int = Query(1),
-            limit: int = Query(PAGE_SIZE),
+        async def get_paginated(
+            request: Request,
+            page: int = Query(1, ge=1),
+            limit: int = Query(PAGE_SIZE, ge=1, le=PAGE_SIZE_MAX),
             sort_by: str = Query("created_at"),
             order: str = Query("asc"),
-            min_date: str = Query(None),
-            max_date: str = Query(None),
+            min_date: datetime.datetime = Query(None),
+            max_date: datetime.datetime = Query(None),
             min_value: int = Query(None),
             max_value: int = Query(None),
             search_field: str = Query(None),
             search: str = Query(None),
-            db: Session = Depends(get_db),
+            cursor: str = Query(None),
+            fields: List[str] = Query(None),
+            include_total: bool = Query(True),
+            db: AsyncSession = Depends(get_db),
             permissions: dict = Depends(self.read_permissions),
         ):
             """
@@ -143,8 +267,9 @@ class BaseRouter:
 
             This endpoint retrieves all records from the database and returns the record details.
 
+            :param request: The incoming request, used for response caching.
             :param page: The page number for pagination.
-            :param limit: The number of records per page.
+            :param limit: The number of records per page, at most PAGE_SIZE_MAX.
             :param sort_by: The field to sort the records by.
             :param order: The order to sort the records in (asc or desc).
             :param min_date: The minimum date to filter the records by.
@@ -153,6 +278,9 @@ class BaseRouter:
             :param max_value: The maximum value to filter the records by.
             :param search_field: The field to search the records by.
             :param search: The search query to filter the records by.
+            :param cursor: The next_cursor of the previous page, to seek to the next page instead of using page offsets.
+            :param fields: The columns to return for each record. All columns are returned if omitted.
+            :param include_total: Whether to count the matching records when paging with a cursor. Skipping it keeps deep pages cheap.
             :param db: Database session dependency.
             :param permissions: Permission dependency.
 
@@ -162,30 +290,74 @@ class BaseRouter:
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
             """
-            return self.get_paginated_records(
-                db,
-                page,
-                limit,
-                sort_by,
-                order,
-                min_date,
-                max_date,
-                min_value,
-                max_value,
-                search_field,
-                search,
+            return await cached_response(
+                request,
+                permissions,
+                lambda: get_paginated_records(
+                    db,
+                    page,
+                    limit,
+                    sort_by,
+                    order,
+                    min_date,
+                    max_date,
+                    min_value,
+                    max_value,
+                    search_field,
+                    search,
+                    cursor,
+                    fields,
+                    include_total,
+                ),
             )
 
+    def generate_get_by_ids_endpoint(self):
+        get_records_by_ids = self.get_records_by_ids
+        json_response = self.json_response
+
+        @self.router.post(
+            "/get_by_ids",
+            status_code=status.HTTP_200_OK,
+            responses=self._responses["get_by_ids"],
+        )
+        async def get_by_ids(
+            ids: List[uuid.UUID] = Body(..., max_length=GET_BY_IDS_MAX_LENGTH),
+            db: AsyncSession = Depends(get_db),
+            cache: dict = Depends(get_request_cache),
+            permissions: dict = Depends(self.read_permissions),
+        ):
+            """
+            Retrieve several records by their IDs.
+
+            This endpoint fetches every requested record with a single query and returns them keyed by ID. IDs with no matching record are left out.
+
+            :param ids: The request body containing the list of record IDs, at most GET_BY_IDS_MAX_LENGTH of them.
+            :param db: Database session dependency.
+            :param cache: Request-scoped row cache dependency.
+            :param permissions: Permission dependency.
+
+            :return: A success message along with the found records keyed by ID.
+
+            :raises HTTPException(420): If a database error occurs.
+            :raises HTTPException(500): If any other error occurred.
+            """
+            return json_response(await get_records_by_ids(ids, db, cache))
+
     def generate_get_by_id_endpoint(self):
+        cached_response = self.cached_response
+        get_record_by_id = self.get_record_by_id
+        get_version = self.model.get_version
+
         @self.router.get(
             "/{record_id}",
             status_code=status.HTTP_200_OK,
-            responses=self.get_record_responses(),
+            responses=self._responses["get_one"],
         )
-        @handle_exceptions
-        async def get_record_by_id(
+        async def get_by_id(
             record_id: str,
-            db: Session = Depends(get_db),
+            request: Request,
+            db: AsyncSession = Depends(get_db),
+            cache: dict = Depends(get_request_cache),
             permissions=Depends(self.read_permissions),
         ):
             """
@@ -194,7 +366,9 @@ class BaseRouter:
             This endpoint retrieves a record identified by the record ID. It fetches the record from the database and returns the record details.
 
             :param record_id: The unique identifier of the record.
+            :param request: The incoming request, used for response caching.
             :param db: Database session dependency.
+            :param cache: Request-scoped row cache dependency.
             :param permissions: Permission dependency.
 
             :return: A success message upon successful retrieval of the record along with the record details.
@@ -204,19 +378,59 @@ class BaseRouter:
             :raises HTTPException(500): If any other error occurred.
 
             """
-            return self.get_record_by_id(record_id, db)
+            return await cached_response(
+                request,
+                permissions,
+                lambda: get_record_by_id(record_id, db, cache),
+                lambda: get_version(db, record_id),
+            )
+
+    def generate_bulk_update_endpoint(self):
+        bulk_update_records = self.bulk_update_records
+        json_response = self.json_response
+
+        @self.router.put(
+            "/bulk",
+            status_code=status.HTTP_200_OK,
+            responses=self._responses["bulk_update"],
+        )
+        async def update_records(
+            request: List[self.bulk_update_schema] = Body(
+                ..., max_length=BULK_MAX_LENGTH
+            ),
+            db: AsyncSession = Depends(get_db),
+            permissions: dict = Depends(self.write_permissions),
+        ):
+            """
+            Update several records at once.
+
+            This endpoint updates every record in the request, each identified by its id, with a single batched statement and one commit.
+
+            :param request: The request body containing the list of records, each with its id and updated data, at most BULK_MAX_LENGTH of them.
+            :param db: Database session dependency.
+            :param permissions: Permission dependency.
+
+            :return: A success message upon successful update of the records along with the updated ids.
+
+            :raises HTTPException(420): If a database error occurs.
+            :raises HTTPException(500): If any other error occurred.
+            """
+            return json_response(await bulk_update_records(request, db))
 
     def generate_update_endpoint(self):
+        update_existing_record = self.update_existing_record
+        json_response = self.json_response
+
         @self.router.put(
             "/{record_id}",
             status_code=status.HTTP_200_OK,
-            responses=self.update_responses(),
+            responses=self._responses["update"],
         )
-        @handle_exceptions
         async def update_record(
             record_id: str,
             request: self.update_schema = Body(...),
-            db: Session = Depends(get_db),
+            db: AsyncSession = Depends(get_db),
+            cache: dict = Depends(get_request_cache),
             permissions: dict = Depends(self.write_permissions),
         ):
             """
@@ -227,6 +441,7 @@ class BaseRouter:
             :param record_id: The unique identifier of the record.
             :param request: The request body containing the updated record data.
             :param db: Database session dependency.
+            :param cache: Request-scoped row cache dependency.
             :param permissions: Permission dependency.
 
             :return: A success message upon successful update of the record along with the updated details.
@@ -236,18 +451,23 @@ class BaseRouter:
             :raises HTTPException(500): If any other error occurred.
 
             """
-            return self.update_existing_record(record_id, request, db)
+            return json_response(
+                await update_existing_record(record_id, request, db, cache)
+            )
 
     def generate_delete_endpoint(self):
+        delete_existing_record = self.delete_existing_record
+        json_response = self.json_response
+
         @self.router.delete(
             "/{record_id}",
             status_code=status.HTTP_200_OK,
-            responses=self.delete_responses(),
+            responses=self._responses["delete"],
         )
-        @handle_exceptions
         async def delete_record(
             record_id: str,
-            db: Session = Depends(get_db),
+            db: AsyncSession = Depends(get_db),
+            cache: dict = Depends(get_request_cache),
             permissions: dict = Depends(self.write_permissions),
         ):
             """
@@ -257,6 +477,7 @@ class BaseRouter:
 
             :param record_id: The unique identifier of the record.
             :param db: Database session dependency.
+            :param cache: Request-scoped row cache dependency.
             :param permissions: Permission dependency.
 
             :return: A success message upon successful deletion of the record.
@@ -265,33 +486,126 @@ class BaseRouter:
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
             """
-            return self.delete_existing_record(record_id, db)
+            return json_response(await delete_existing_record(record_id, db, cache))
 
     # Core Functionality
 
-    def get_all_records(
+    def encode_json(self, content):
+        if self.response_struct is None:
+            return orjson.dumps(content)
+        return self._encoder.encode(content)
+
+    def json_response(self, body, status_code: int = status.HTTP_200_OK):
+        # Dumping the response model straight to the encoder skips FastAPI's
+        # jsonable_encoder pass over every value of every record.
+        return Response(
+            content=self.encode_json(body.model_dump()),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    def encode_body(self, response):
+        if self.response_struct is None:
+            return self.encode_json(response.model_dump())
+        # dict(response) is a shallow copy of the top-level fields; only the
+        # records are converted, straight into structs.
+        content = dict(response)
+        data = content["data"]
+        if isinstance(data, list):
+            content["data"] = msgspec.convert(data, self._struct_list_type)
+        elif data is not None:
+            content["data"] = msgspec.convert(data, self.response_struct)
+        return self.encode_json(content)
+
+    async def cached_response(
+        self, request: Request, permissions, build, get_version=None
+    ):
+        """Serve a GET response from the response cache, building it on a miss.
+
+        Args:
+            request (Request): The incoming request; its path and query string key the cache.
+            permissions: The caller's permissions, so cached bodies are never shared across principals.
+            build: A callable returning an awaitable of the response model.
+            get_version: An optional callable returning an awaitable of a version that changes whenever the data behind the response does.
+
+        Returns:
+            A JSON response carrying an ETag, or 304 Not Modified when it matches If-None-Match.
+        """
+        key = (
+            self.model.__tablename__,
+            request.url.path,
+            str(request.query_params),
+            str(permissions),
+        )
+        etag = None
+        if get_version is not None:
+            # The weak ETag is derived from the data version rather than the
+            # body, so a revalidation is answered before the full query runs.
+            # Keying the cache by version also drops bodies made stale by
+            # writes that went through another worker.
+            version = await get_version()
+            digest = hashlib.sha256(repr((key, version)).encode()).hexdigest()
+            etag = f'W/"{digest}"'
+            if self._etag_matches(request, etag):
+                return self._not_modified(etag)
+            key = (*key, version)
+
+        cached = response_cache.get(key)
+        if cached is None:
+            body = self.encode_body(await build())
+            body_etag = response_cache.set(key, body)
+        else:
+            body_etag, body = cached
+        etag = etag or body_etag
+
+        if self._etag_matches(request, etag):
+            return self._not_modified(etag)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=self._cache_headers(etag),
+        )
+
+    @staticmethod
+    def _cache_headers(etag: str):
+        return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    @staticmethod
+    def _etag_matches(request: Request, etag: str):
+        if_none_match = request.headers.get("if-none-match", "")
+        return etag in (tag.strip() for tag in if_none_match.split(","))
+
+    def _not_modified(self, etag: str):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=self._cache_headers(etag)
+        )
+
+    async def get_all_records(
         self,
         db,
         sort_by: str = "created_at",
         order: str = "asc",
-        min_date: str = None,
-        max_date: str = None,
+        min_date: datetime.datetime = None,
+        max_date: datetime.datetime = None,
         min_value: int = None,
         max_value: int = None,
         search_field: str = None,
         search: str = None,
+        fields: List[str] = None,
+        limit: int = GET_ALL_LIMIT,
+        offset: int = 0,
     ):
-        f"""Retrieve all {self.model.__name__} records from database
+        """Retrieve all records from database
 
         Args:
-            db (Session, optional): Database Session Defaults to Depends(get_db).
+            db (AsyncSession, optional): Database Session Defaults to Depends(get_db).
 
         Raises:
-            :raises HTTPException(204): If no {self.model.__name__} records are found.
+            :raises HTTPException(204): If no records are found.
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
         """
-        records = self.model.get_all(
+        records = await self.model.get_all(
             db,
             sort_by,
             order,
@@ -301,55 +615,49 @@ class BaseRouter:
             max_value,
             search_field,
             search,
+            fields,
+            options=self.eager_load,
+            limit=limit,
+            offset=offset,
         )
 
         if records is None:
             return APIBaseListResponse(
-                message=f"No {self.model.__name__} records found", data=[]
+                message=self._msg_none_found, data=[]
             )
 
         return APIBaseListResponse(
-            message=f"All {self.model.__name__} records", data=records
+            message=self._msg_all_found, data=records
         )
 
-    def get_paginated_records(
+    async def get_paginated_records(
         self,
         db,
         page: int = 1,
         limit: int = PAGE_SIZE,
         sort_by: str = "created_at",
         order: str = "asc",
-        min_date: str = None,
-        max_date: str = None,
+        min_date: datetime.datetime = None,
+        max_date: datetime.datetime = None,
         min_value: int = None,
         max_value: int = None,
         search_field: str = None,
         search: str = None,
+        cursor: str = None,
+        fields: List[str] = None,
+        include_total: bool = True,
     ):
-        f"""Retrieve all {self.model.__name__} records from database
+        """Retrieve all records from database
 
         Args:
-            db (Session, optional): Database Session Defaults to Depends(get_db).
+            db (AsyncSession, optional): Database Session Defaults to Depends(get_db).
 
         Raises:
-            :raises HTTPException(204): If no {self.model.__name__} records are found.
+            :raises HTTPException(204): If no records are found.
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
         """
-        records = self.model.get_paginated(
-            db,
-            page,
-            limit,
-            sort_by,
-            order,
-            min_date,
-            max_date,
-            min_value,
-            max_value,
-            search_field,
-            search,
-        )
-        pagination_metadata = self.model.get_pagination_metadata(
+        records, pagination_metadata = await self.model.get_paginated(
             db,
             page,
             limit,
@@ -361,82 +669,106 @@ class BaseRouter:
             max_value,
             search_field,
             search,
+            cursor,
+            fields,
+            include_total,
         )
 
         if records is None:
             return APIBasePaginatedResponse(
-                message=f"No {self.model.__name__} records found",
+                message=self._msg_none_found,
                 data=[],
                 page=page,
                 total_pages=pagination_metadata["total_pages"],
                 total_records=pagination_metadata["total_count"],
                 page_size=limit,
+                next_cursor=pagination_metadata["next_cursor"],
             )
 
         return APIBasePaginatedResponse(
-            message=f"All {self.model.__name__} records",
+            message=self._msg_all_found,
             data=records,
             page=page,
             total_pages=pagination_metadata["total_pages"],
             total_records=pagination_metadata["total_count"],
             page_size=limit,
+            next_cursor=pagination_metadata["next_cursor"],
         )
 
-    def get_record_by_id(self, record_id, db):
-        f"""Retrieve {self.model.__name__} record with given id from database
+    async def get_record_by_id(self, record_id, db, cache=None):
+        """Retrieve record with given id from database
 
         Args:
-            db (Session, optional): Database Session Defaults to Depends(get_db).
+            db (AsyncSession, optional): Database Session Defaults to Depends(get_db).
 
         Raises:
-            :raises HTTPException(204): If no {self.model.__name__} record with given id is found.
+            :raises HTTPException(204): If no record with given id is found.
             :raises HTTPException(420): If a database error occurs.
             :raises HTTPException(500): If any other error occurred.
         """
-        record = self.model.get_by_id(record_id, db)
+        record = await self.model.get_by_id(record_id, db, cache)
 
         if record is None:
-            raise NotFoundErrorResponse(f"No {self.model.__name__} Found With Given Id")
+            raise NotFoundErrorResponse(self._msg_not_found_id)
+
+        return APIBaseResponse(message=self._msg_found, data=record)
 
-        return APIBaseResponse(message=f"{self.model.__name__} Found", data=record)
+    async def get_records_by_ids(self, ids, db, cache=None):
+        records = await self.model.get_by_ids(db, ids, cache)
+        # JSON object keys have to be strings
+        return APIBaseResponse(
+            message=f"{len(records)} {self._model_name} Records Found",
+            data={str(record_id): record for record_id, record in records.items()},
+        )
 
-    def create_new_record(self, request, db):
-        new_record_data = {**request.model_dump()}
-        record = self.model.create(db, **new_record_data)
+    async def create_new_record(self, request, db):
+        record = await self.model.create(db, **request.model_dump())
 
         if not record:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error Occurred While Creating {self.model.__name__}")
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=self._msg_create_failed)
 
+        response_cache.invalidate(self.model.__tablename__)
         return APIBaseResponse(
-            message=f"{self.model.__name__} Created Successfully", data=record
+            message=self._msg_created, data=record
         )
 
-    def update_existing_record(self, record_id, request, db):
+    async def bulk_create_records(self, request, db):
+        records = await self.model.bulk_create(
+            db, [item.model_dump() for item in request]
+        )
+        response_cache.invalidate(self.model.__tablename__)
+        return APIBaseListResponse(
+            message=f"{len(records)} {self._model_name} Records Created Successfully",
+            data=records,
+        )
 
-        existing_record = self.model.get_by_id(record_id, db)
-        if existing_record is None:
-            raise NotFoundErrorResponse(f"No {self.model.__name__} Found With Given Id")
+    async def bulk_update_records(self, request, db):
+        ids = await self.model.bulk_update(
+            db, [item.model_dump() for item in request]
+        )
+        response_cache.invalidate(self.model.__tablename__)
+        return APIBaseListResponse(
+            message=f"{len(ids)} {self._model_name} Records Updated Successfully",
+            data=ids,
+        )
 
-        new_record_data = {**request.model_dump()}
-        record = self.model.update(record_id, db, **new_record_data)
+    async def update_existing_record(self, record_id, request, db, cache=None):
+        record = await self.model.update(record_id, db, cache, **request.model_dump())
 
-        if not record:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error Occurred While Updating {self.model.__name__}",
-            )
+        if record is None:
+            raise NotFoundErrorResponse(self._msg_not_found_id)
 
+        response_cache.invalidate(self.model.__tablename__)
         return APIBaseResponse(
-            message=f"{self.model.__name__} Updated Successfully", data=record
+            message=self._msg_updated, data=record
         )
 
-    def delete_existing_record(self, record_id, db):
-        existing_record = self.model.get_by_id(record_id, db)
-        if existing_record is None:
-            raise NotFoundErrorResponse(f"No {self.model.__name__} Found With Given Id")
+    async def delete_existing_record(self, record_id, db, cache=None):
+        if not await self.model.delete(record_id, db, cache):
+            raise NotFoundErrorResponse(self._msg_not_found_id)
 
-        self.model.delete(record_id, db)
-        return APIBaseResponse(message=f"{self.model.__name__} Deleted Successfully")
+        response_cache.invalidate(self.model.__tablename__)
+        return APIBaseResponse(message=self._msg_deleted)
 
     # Responses
 
@@ -445,7 +777,7 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_200_OK: {
                 "model": self.get_all_schema,
-                "description": f"The {self.model.__name__} records were successfully retrieved from the database. The response includes a JSON object containing the records' details.",
+                "description": f"The {self._model_name} records were successfully retrieved from the database. The response includes a JSON object containing the records' details.",
             },
         }
 
@@ -454,7 +786,7 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_200_OK: {
                 "model": self.get_paginated_schema,
-                "description": f"The {self.model.__name__} records were successfully retrieved from the database. The response includes a JSON object containing the records' details.",
+                "description": f"The {self._model_name} records were successfully retrieved from the database. The response includes a JSON object containing the records' details.",
             },
         }
 
@@ -463,7 +795,16 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_200_OK: {
                 "model": self.get_response_schema,
-                "description": f"The {self.model.__name__} record was successfully retrieved from the database. The response includes a JSON object containing the record's details.",
+                "description": f"The {self._model_name} record was successfully retrieved from the database. The response includes a JSON object containing the record's details.",
+            },
+        }
+
+    def get_records_by_ids_responses(self):
+        return {
+            **self.base_response,
+            status.HTTP_200_OK: {
+                "model": APIBaseResponse,
+                "description": f"The requested {self._model_name} records were retrieved from the database with a single query. The response includes a JSON object mapping each found ID to the record's details.",
             },
         }
 
@@ -472,7 +813,16 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_201_CREATED: {
                 "model": self.get_response_schema,
-                "description": f"The {self.model.__name__} was successfully created. The response includes a success message and a JSON object containing the details of the created {self.model.__name__}.",
+                "description": f"The {self._model_name} was successfully created. The response includes a success message and a JSON object containing the details of the created {self._model_name}.",
+            },
+        }
+
+    def bulk_create_responses(self):
+        return {
+            **self.base_response,
+            status.HTTP_201_CREATED: {
+                "model": self.get_all_schema,
+                "description": f"The {self._model_name} records were successfully created. The response includes a success message and a JSON object containing the details of the created records.",
             },
         }
 
@@ -481,7 +831,16 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_200_OK: {
                 "model": self.get_response_schema,
-                "description": f"The {self.model.__name__} was successfully updated. The response includes a success message and a JSON object containing the updated details of the {self.model.__name__}.",
+                "description": f"The {self._model_name} was successfully updated. The response includes a success message and a JSON object containing the updated details of the {self._model_name}.",
+            },
+        }
+
+    def bulk_update_responses(self):
+        return {
+            **self.base_response,
+            status.HTTP_200_OK: {
+                "model": APIBaseListResponse,
+                "description": f"The {self._model_name} records were successfully updated. The response includes a success message and the ids of the updated records.",
             },
         }
 
@@ -490,6 +849,6 @@ class BaseRouter:
             **self.base_response,
             status.HTTP_200_OK: {
                 "model": APIBaseResponse,
-                "description": f"The {self.model.__name__} was successfully deleted. The response includes a success message.",
+                "description": f"The {self._model_name} was successfully deleted. The response includes a success message.",
             },
         }
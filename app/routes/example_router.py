@@ -5,6 +5,7 @@ from app.schemas.example_schemas import (
     ExampleBaseListResponseSchema,
     ExampleBasePaginatedResponseSchema,
     ExampleBaseResponseSchema,
+    GetExampleStruct,
 )
 from app.utils.permission_utils import check_read_permissions, check_write_permissions
 
@@ -22,6 +23,7 @@ class ExampleRouter(BaseRouter):
             ExampleBase,
             check_read_permissions,
             check_write_permissions,
+            response_struct=GetExampleStruct,
         )
 
 
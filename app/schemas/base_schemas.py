@@ -1,5 +1,7 @@
 """This file contains the schemas used for the open API documentation. It contains schemas based on different scenarios."""
 
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -12,7 +14,7 @@ class NotFoundErrorResponse(Exception):
 
 class APIBaseResponse(BaseModel):
     message: str
-    data: dict = None
+    data: Optional[dict] = None
 
 
 class APIBaseListResponse(BaseModel):
@@ -24,6 +26,7 @@ class APIBasePaginatedResponse(BaseModel):
     message: str
     data: list
     page: int
-    total_pages: int
-    total_records: int
+    total_pages: Optional[int]
+    total_records: Optional[int]
     page_size: int
+    next_cursor: Optional[str] = None
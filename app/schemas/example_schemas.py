@@ -1,5 +1,10 @@
-from pydantic import BaseModel
-from typing import List
+import datetime
+import uuid
+from typing import List, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+from pydantic import BaseModel, ConfigDict
 from app.schemas.base_schemas import (
     APIBaseResponse,
     APIBaseListResponse,
@@ -13,30 +18,37 @@ class ExampleBase(BaseModel):
 
 
 class GetExampleBaseSchema(ExampleBase):
-    id: int
+    id: uuid.UUID
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExampleBaseResponseSchema(APIBaseResponse):
     data: GetExampleBaseSchema
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExampleBaseListResponseSchema(APIBaseListResponse):
     data: List[GetExampleBaseSchema]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExampleBasePaginatedResponseSchema(APIBasePaginatedResponse):
     data: List[GetExampleBaseSchema]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# msgspec twin of GetExampleBaseSchema used to encode GET responses. Fields
+# default to UNSET so rows narrowed with ?fields= leave the others out.
+class GetExampleStruct(msgspec.Struct, omit_defaults=True):
+    id: Union[uuid.UUID, UnsetType] = UNSET
+    name: Union[str, UnsetType] = UNSET
+    value: Union[int, UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+    created_at: Union[datetime.datetime, UnsetType] = UNSET
+    updated_at: Union[datetime.datetime, UnsetType] = UNSET
@@ -0,0 +1,46 @@
+import hashlib
+import time
+
+from app.config import settings
+
+
+class ResponseCache:
+    """TTL cache of serialized GET response bodies and their ETags.
+
+    Keys are tuples whose first item is a namespace (the model's table name),
+    so every entry of a model can be dropped at once when it is written to.
+    Entries live in the worker process; writes served by another worker are
+    only picked up once the TTL expires.
+    """
+
+    def __init__(self, ttl: int, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, etag, body = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return etag, body
+
+    def set(self, key, body: bytes):
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # dicts keep insertion order, so this evicts the oldest entry
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, etag, body)
+        return etag
+
+    def invalidate(self, namespace: str):
+        for key in [key for key in self._entries if key[0] == namespace]:
+            del self._entries[key]
+
+
+response_cache = ResponseCache(
+    settings.RESPONSE_CACHE_TTL, settings.RESPONSE_CACHE_MAXSIZE
+)
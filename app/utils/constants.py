@@ -1 +1,18 @@
 PAGE_SIZE = 10
+PAGE_SIZE_MAX = 100
+GET_ALL_LIMIT = 100
+GET_ALL_MAX_LIMIT = 1000
+# Keeps one id IN (...) list well below asyncpg's 32767 bind parameters.
+GET_BY_IDS_MAX_LENGTH = 1000
+# Same bound for the bodies of the bulk create and update endpoints.
+BULK_MAX_LENGTH = 1000
+STREAM_CHUNK_SIZE = 1000
+
+DATABASE_ERROR_DESCRIPTION = (
+    "A database error occurred while processing the request. This could be due "
+    "to a connection issue, a query error, or a data integrity issue."
+)
+SERVER_ERROR_DESCRIPTION = (
+    "An unexpected error occurred while processing the request. This could be "
+    "due to a server issue or an unexpected exception."
+)
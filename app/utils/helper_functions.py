@@ -1,54 +1,154 @@
+from app.config import settings
 from app.schemas.base_schemas import NotFoundErrorResponse, ErrorResponse
+import base64
+import binascii
 import datetime
-import pytz
-from fastapi import HTTPException, status
+import json
+import logging
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
-from functools import wraps
+from zoneinfo import ZoneInfo
 
+_IST = ZoneInfo("Asia/Kolkata")
+
+logger = logging.getLogger(__name__)
+
+
+def _error_response(status_code: int, detail: str, error: str):
+    return ORJSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers={"X-Error": error},
+    )
+
+
+async def database_error_handler(request: Request, exc: SQLAlchemyError):
+    # Handle database connection errors. SQLAlchemy messages carry the SQL
+    # and its parameters, so they only reach the client in debug mode.
+    logger.error(
+        "Database error while processing %s %s: %s",
+        request.method,
+        request.url.path,
+        exc,
+    )
+    if settings.DEBUG:
+        detail = f"Database connection error occurred: {exc}"
+    else:
+        detail = "Database connection error occurred"
+    return _error_response(420, detail, "Database Error")
+
+
+async def not_found_error_handler(request: Request, exc: NotFoundErrorResponse):
+    # Handle 404 errors
+    return _error_response(
+        status.HTTP_404_NOT_FOUND,
+        f"Resource not found: {exc}",
+        "Resource Not Found",
+    )
+
+
+async def value_error_handler(request: Request, exc: ValueError):
+    # Handle value errors
+    return _error_response(
+        status.HTTP_400_BAD_REQUEST,
+        f"Bad request error occurred: {str(exc)}",
+        "Bad Request",
+    )
+
+
+async def internal_error_handler(request: Request, exc: Exception):
+    # Handle other unexpected errors. The exception text may leak internals,
+    # so it only reaches the client in debug mode.
+    if settings.DEBUG:
+        detail = f"Internal server error occurred: {str(exc)}"
+    else:
+        detail = "Internal server error occurred"
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR, detail, "Internal Server Error"
+    )
+
+
+class InternalErrorMiddleware:
+    """Answer unexpected exceptions with a 500 from inside the app's middleware.
+
+    A handler registered for ``Exception`` runs in Starlette's
+    ServerErrorMiddleware, outside every user middleware, so its responses
+    would lack the CORS headers. Registered before CORSMiddleware, this sits
+    inside it instead.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-def handle_exceptions(func):
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
         try:
-            return await func(*args, **kwargs)
-        except HTTPException:
-            # Re-raise HTTPExceptions as they are
-            raise
-        except SQLAlchemyError as e:
-            # Handle database connection errors
-            raise HTTPException(
-                status_code=420,
-                detail=f"Database connection error occurred: {e}",
-                headers={"X-Error": "Database Error"},
-            )
-        except NotFoundErrorResponse as e:
-            # Handle 404 errors
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Resource not found: {e}",
-                headers={"X-Error": "Resource Not Found"},
-            )
-        except ValueError as e:
-            # Handle value errors
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Bad request error occurred: {str(e)}",
-                headers={"X-Error": "Bad Request"},
-            )
-        except Exception as e:
-            # Handle other unexpected errors
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Internal server error occurred: {str(e)}",
-                headers={"X-Error": "Internal Server Error"},
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.exception(
+                "Unhandled error while processing %s %s", scope["method"], scope["path"]
             )
+            response = await internal_error_handler(Request(scope), exc)
+            await response(scope, receive, send)
 
-    return wrapper
+
+def register_exception_handlers(app: FastAPI):
+    # Starlette looks handlers up by walking the exception's MRO, so the
+    # happy path carries no try/except of its own. HTTPExceptions keep
+    # FastAPI's default handler. Call this before adding CORSMiddleware so
+    # that InternalErrorMiddleware ends up inside it.
+    app.add_exception_handler(SQLAlchemyError, database_error_handler)
+    app.add_exception_handler(NotFoundErrorResponse, not_found_error_handler)
+    app.add_exception_handler(ValueError, value_error_handler)
+    app.add_middleware(InternalErrorMiddleware)
 
 
 def get_current_time():
-    return (
-        datetime.datetime.utcnow()
-        .replace(tzinfo=pytz.utc)
-        .astimezone(pytz.timezone("Asia/Kolkata"))
-    )
+    return datetime.datetime.now(_IST)
+
+
+def get_request_cache(request: Request):
+    """Return the dict that caches rows looked up by id for this request."""
+    cache = getattr(request.state, "row_cache", None)
+    if cache is None:
+        cache = request.state.row_cache = {}
+    return cache
+
+
+def encode_cursor(*values):
+    """Encode the sort key of the last row of a page into an opaque cursor."""
+    payload = json.dumps(values, default=str).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str):
+    """Decode a cursor produced by ``encode_cursor`` back into its values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("Invalid pagination cursor")
+    last_sort_value, last_id = values
+    # bool is an int subclass but never a sort key
+    if (
+        not isinstance(last_sort_value, (str, int, float))
+        or isinstance(last_sort_value, bool)
+        or not isinstance(last_id, str)
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return values
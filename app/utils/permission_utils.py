@@ -1,8 +1,42 @@
-def check_read_permissions():
-    # Some auth logic
-    return {"name": "admin"}
+from functools import lru_cache
 
+from fastapi import HTTPException, Request, status
 
-def check_write_permissions():
-    # Some auth logic
-    return {"name": "admin"}
+ROLE_PERMISSIONS = {
+    "admin": ("read", "write"),
+}
+
+
+@lru_cache(maxsize=1024)
+def get_role_permissions(role: str):
+    # The role map is static, so the lookup is shared across requests.
+    return frozenset(ROLE_PERMISSIONS.get(role, ()))
+
+
+def get_permissions(request: Request):
+    # Resolved once per request and stored on request.state, so every
+    # permission check after the first one reuses it.
+    permissions = getattr(request.state, "permissions", None)
+    if permissions is None:
+        # Some auth logic
+        permissions = {"name": "admin"}
+        request.state.permissions = permissions
+    return permissions
+
+
+def _check_permission(request: Request, permission: str):
+    permissions = get_permissions(request)
+    if permission not in get_role_permissions(permissions["name"]):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Missing {permission} permission",
+        )
+    return permissions
+
+
+def check_read_permissions(request: Request):
+    return _check_permission(request, "read")
+
+
+def check_write_permissions(request: Request):
+    return _check_permission(request, "write")
@@ -1,7 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app.config import settings
+from app.database import engine
+from app.routes import example_router
+from app.utils.helper_functions import register_exception_handlers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the OpenAPI schema at startup rather than on the first docs request.
+    if app.openapi_url:
+        app.openapi()
+    yield
+    # Close pooled connections so the database does not have to time them out.
+    await engine.dispose()
 
-app = FastAPI(title="Latest Fastapi Crud API")
+
+# The generated schema covers every response of every registered model, so
+# production skips it along with the docs pages that serve it.
+docs_enabled = settings.ENVIRONMENT != "production"
+
+app = FastAPI(
+    title="Latest Fastapi Crud API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    openapi_url="/openapi.json" if docs_enabled else None,
+    docs_url="/docs" if docs_enabled else None,
+    redoc_url="/redoc" if docs_enabled else None,
+)
+# Registered before CORSMiddleware so error responses still get CORS headers.
+register_exception_handlers(app)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,8 +48,5 @@ app.add_api_route(
     "/health", lambda: {"status": "ok"}, methods=["GET"], tags=["Health Check"]
 )
 
-# Importing all routers
-from app.routes import example_router
-
 # Adding all routers
 app.include_router(example_router.router, prefix="/example", tags=["Example"])